@@ -1,10 +1,10 @@
 """Monitoring progress of git operations."""
 
 import functools
-import operator
 import logging
 import shutil
 import sys
+import time
 import typing as t
 
 import git
@@ -24,54 +24,105 @@ _KNOWN_OPERATIONS_STRINGS = {
     512: 'fetching remote of submodule',
     # git.remote.RemoteProgress.CHECKING_OUT
 }
-_KNOWN_OPERATIONS: int = functools.reduce(operator.or_, _KNOWN_OPERATIONS_STRINGS.keys())
+_KNOWN_OPERATIONS = 0x3ff  # all keys of _KNOWN_OPERATIONS_STRINGS
+_NOT_KNOWN_OPERATIONS = ~_KNOWN_OPERATIONS
 _KNOWN_OPERATIONS_PHASES = git.remote.RemoteProgress.BEGIN | git.remote.RemoteProgress.END
 
+
+def _count_str(count: t.Any) -> str:
+    """Convert progress count, which can be either int or float, to string."""
+    if type(count) is int:  # pylint: disable=unidiomatic-typecheck
+        return str(count)
+    return str(int(count))
+
+
+# used by ActionProgress.update(), keyed by presence of current and maximum counts
+_PROGRESS_FORMATTERS: t.Dict[t.Tuple[bool, bool], t.Callable[[t.Any, t.Any], str]] = {
+    (False, False): lambda *_: '',
+    (True, False): lambda cur_count, _: _count_str(cur_count),
+    (False, True): lambda _, max_count: _count_str(max_count),
+    (True, True): lambda cur_count, max_count:
+        f'{cur_count / max_count:3.0%} ({_count_str(cur_count)}/{_count_str(max_count)})'}
+
+# minimal interval (in seconds) between progress reports not written to a terminal
+_NON_TTY_UPDATE_INTERVAL = 1.0
+
 _CARET_UP = '\033[1A'  # TODO: works only in bash, but what about cmd?
 
+_ERASE_LINE = '\033[2K'
+
+_CLEAR_LINE = f'\r{_ERASE_LINE}'
+
+_CLEAR_LINE_AND_PREVIOUS = f'{_CLEAR_LINE}{_CARET_UP}{_ERASE_LINE}'
+
 _LOG = logging.getLogger(__name__)
 
 
-def _create_operation_strings(op_code: int):
-    """Create operation strings."""
+@functools.lru_cache(maxsize=1)
+def _terminal_width() -> int:
+    """Detect width of the terminal, only once per process."""
+    try:
+        term_size = shutil.get_terminal_size()
+    except ValueError:
+        return 100
+    if term_size.columns < 16:
+        _LOG.warning('detected terminal width is %i', term_size.columns)
+    return term_size.columns if term_size.columns else 100
+
+
+@functools.lru_cache(maxsize=256)
+def _create_operation_strings(op_code: int) -> t.Tuple[str, ...]:
+    """Create operation strings.
+
+    Results are cached, because progress reports use only a handful of distinct operation codes.
+    """
     operation_strings = []
-    for key, value in _KNOWN_OPERATIONS_STRINGS.items():
-        if op_code & key:
-            operation_strings.append(value)
-    unknown_operations = op_code & ~_KNOWN_OPERATIONS  # pylint: disable=invalid-unary-operand-type
+    known_operations = op_code & _KNOWN_OPERATIONS
+    while known_operations:
+        operation = known_operations & -known_operations  # lowest set bit
+        operation_strings.append(_KNOWN_OPERATIONS_STRINGS[operation])
+        known_operations ^= operation
+    unknown_operations = op_code & _NOT_KNOWN_OPERATIONS
     if unknown_operations:
         operation_strings.append(
             f'unknown operation code(s): {unknown_operations} ({unknown_operations:032b})')
-    return operation_strings
+    return tuple(operation_strings)
+
+
+@functools.lru_cache(maxsize=256)
+def _create_description(op_code: int) -> str:
+    """Create description that prefixes the progress report of given operation."""
+    operation_strings = _create_operation_strings(op_code)
+    return f'{" ".join(operation_strings)}: ' if operation_strings else ''
 
 
 class ActionProgress(git.remote.RemoteProgress):
     """Emulate usual git progress reports in the console when working with GitPython."""
 
     def __init__(self, inline: bool = True, f_d=None):
-        """When no redirected_output_fd is given, use stdout."""
+        """When no redirected_output_fd is given, use stdout.
+
+        If the output is not a terminal, progress is never printed inline, and reports are
+        throttled, except for the ones that begin or end an operation.
+        """
         assert isinstance(inline, bool)
 
         super().__init__()
         self.printed_lines = False
         self.line_len = 0  # type: int
-        try:
-            term_size = shutil.get_terminal_size()
-        except ValueError:
-            self.line_width = 100
-        else:
-            _LOG.log(logging.WARNING if term_size.columns < 16 else logging.NOTSET,
-                     'detected terminal width is %i', term_size.columns)
-            self.line_width = term_size.columns if term_size.columns else 100
-
+        self.line_width = _terminal_width()
         assert self.line_width > 0
 
-        self.inline = inline
         self.f_d = f_d if f_d else sys.stdout
+        self._is_tty: bool = getattr(self.f_d, 'isatty', lambda: False)()
+        self.inline = inline and self._is_tty
+        # last printed update and when it was printed, used to skip repeated or too frequent ones
+        self._last_report: t.Optional[t.Tuple[tuple, float]] = None
 
     def _print_without_nl(self, text: str):
         if self.inline:
-            print(text, end='', flush=True, file=self.f_d)
+            self.f_d.write(text)
+            self.f_d.flush()
         else:
             self._print_with_nl(text)
 
@@ -80,35 +131,34 @@ class ActionProgress(git.remote.RemoteProgress):
 
     def update(self, op_code: int, cur_count: t.Any, max_count: t.Any = None, message: str = ''):
         """Override git.remote.RemoteProgress.update."""
-        operation_strings = _create_operation_strings(op_code)
-        description = f'{" ".join(operation_strings)}: ' if operation_strings else ''
-        progress = ''
-        if cur_count:
-            progress += str(int(cur_count))
-        if cur_count and max_count:
-            progress += '/'
-        if max_count:
-            progress += str(int(max_count))
-        if cur_count and max_count:
-            max_c = max_count or 100
-            progress = f'{cur_count / max_c:3.0%} ({progress})'
+        update = (op_code, cur_count, max_count, message)
+        if self._last_report is not None:
+            last_update, last_print_time = self._last_report
+            if update == last_update:
+                return
+            if not self._is_tty and not op_code & _KNOWN_OPERATIONS_PHASES \
+                    and time.monotonic() - last_print_time < _NON_TTY_UPDATE_INTERVAL:
+                return
+        description = _create_description(op_code)
+        progress = _PROGRESS_FORMATTERS[bool(cur_count), bool(max_count)](cur_count, max_count)
         if message:
             if message.startswith(', '):
                 message = message[2:]
             message = ' - ' + message
         else:
             message = ''
+        line = f'{description}{progress}{message}'
         if self.inline and self.line_len > 0:
             if self.line_len < self.line_width:
-                self._print_without_nl(f'\r{" " * self.line_len}\r')
+                text = f'{_CLEAR_LINE}{line}'
             else:
-                self._print_without_nl(f'\r{" " * (self.line_width - 1)}\r')
-                self._print_without_nl(_CARET_UP)
-                self._print_without_nl(f'{" " * (self.line_width - 1)}\r')
-        line = f'{description}{progress}{message}'
+                text = f'{_CLEAR_LINE_AND_PREVIOUS}{line}'
+        else:
+            text = line
         self.line_len = len(line)
-        self._print_without_nl(line)
+        self._print_without_nl(text)
         self.printed_lines = True
+        self._last_report = (update, time.monotonic())
 
     def finalize(self):
         """To be ran after the last progress report."""
@@ -117,3 +167,4 @@ class ActionProgress(git.remote.RemoteProgress):
                 self._print_with_nl('')
             self.printed_lines = False
             self.line_len = 0
+            self._last_report = None
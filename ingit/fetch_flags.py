@@ -18,16 +18,30 @@ _KNOWN_STRINGS = {
     git.FetchInfo.ERROR: 'error'  # 128
 }
 
-_KNOWN_FLAGS = functools.reduce(operator.or_, _KNOWN_STRINGS.keys())
+_KNOWN_FLAGS = 0xff  # all keys of _KNOWN_STRINGS
+
+# used by create_fetch_info_strings() when exactly one known flag is set, which is typical
+_SINGLE_FLAG_INFO = {
+    flag: ((string,), '--' if flag == git.FetchInfo.HEAD_UPTODATE else '!!')
+    for flag, string in _KNOWN_STRINGS.items()}
 
 
 def info_for_known_flags(
-        flags: int, known_strings: t.Mapping[t.Any, str]) -> t.MutableSequence[str]:
-    """Create string sequence that represents given flags according to given mapping."""
+        flags: int, known_strings: t.Mapping[int, str],
+        known_flags: t.Optional[int] = None) -> t.MutableSequence[str]:
+    """Create string sequence that represents given flags according to given mapping.
+
+    Each key of the mapping must be a single-bit flag. The known flags mask is computed
+    from the mapping if it is not given.
+    """
+    if known_flags is None:
+        known_flags = functools.reduce(operator.or_, known_strings.keys(), 0)
     info_strings = []
-    for key, value in known_strings.items():
-        if flags & key:
-            info_strings.append(value)
+    flags &= known_flags
+    while flags:
+        flag = flags & -flags  # lowest set bit
+        info_strings.append(known_strings[flag])
+        flags ^= flag
     return info_strings
 
 
@@ -42,11 +56,16 @@ def info_for_unknown_flags(flags: int, known_flags: int) -> t.MutableSequence[st
 
 def create_fetch_info_strings(info: git.FetchInfo):
     """Create FetchInfo strings."""
-    info_strings = info_for_known_flags(info.flags, _KNOWN_STRINGS)
-    prefix = '!!'
-    if info.flags & info.HEAD_UPTODATE:
-        prefix = '--'
-    info_strings += info_for_unknown_flags(info.flags, _KNOWN_FLAGS)
+    try:
+        single_flag_strings, prefix = _SINGLE_FLAG_INFO[info.flags]
+    except KeyError:
+        info_strings = info_for_known_flags(info.flags, _KNOWN_STRINGS, _KNOWN_FLAGS)
+        prefix = '!!'
+        if info.flags & info.HEAD_UPTODATE:
+            prefix = '--'
+        info_strings += info_for_unknown_flags(info.flags, _KNOWN_FLAGS)
+    else:
+        info_strings = list(single_flag_strings)
     if info.note:
         info_strings.append(f'note: {info.note.strip()}')
     return (info_strings, prefix)
@@ -2,11 +2,18 @@
 
 import json
 import json.decoder
+import os
 import pathlib
 import platform
+import typing as t
 
 from boilerplates.config import CONFIGS_PATH, normalize_path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 from ._version import VERSION
 from .runtime_interface import ask
 
@@ -14,41 +21,114 @@ JSON_INDENT = 2
 
 JSON_ENSURE_ASCII = False
 
+JSON_COMPACT_SEPARATORS = (',', ':')
+
+COMPACT_JSON_ENVVAR = 'INGIT_COMPACT_JSON'
+
+# orjson never escapes non-ASCII characters, and its only indentation option is 2 spaces
+_ORJSON_COMPACT_OPTIONS = 0 if orjson is None else orjson.OPT_NON_STR_KEYS
+_ORJSON_OPTIONS = 0 if orjson is None else _ORJSON_COMPACT_OPTIONS | orjson.OPT_INDENT_2
+
+_HOSTNAME = platform.node()
+
 CONFIG_DIRECTORY = CONFIGS_PATH.joinpath('ingit')
 RUNTIME_CONFIG_PATH = CONFIG_DIRECTORY.joinpath('ingit_config.json')
 REPOS_CONFIG_PATH = CONFIG_DIRECTORY.joinpath('ingit_repos.json')
 
 
-def json_to_str(data: dict) -> str:
+def _is_pretty(pretty: t.Optional[bool]) -> bool:
+    """Resolve whether JSON should be indented -- by default, unless it's disabled via envvar."""
+    if pretty is None:
+        return os.environ.get(COMPACT_JSON_ENVVAR, '0') != '1'
+    return pretty
+
+
+def json_to_str(data: dict, pretty: t.Optional[bool] = None) -> str:
+    """Convert an object into JSON string.
+
+    The JSON is indented if pretty is True, and compact if it is False. If it is None,
+    the JSON is indented unless INGIT_COMPACT_JSON environment variable is set to 1.
+    """
     assert isinstance(data, dict), type(data)
-    return json.dumps(data, indent=JSON_INDENT, ensure_ascii=JSON_ENSURE_ASCII)
+    pretty = _is_pretty(pretty)
+    if orjson is None:
+        if pretty:
+            return json.dumps(data, indent=JSON_INDENT, ensure_ascii=JSON_ENSURE_ASCII)
+        return json.dumps(
+            data, separators=JSON_COMPACT_SEPARATORS, ensure_ascii=JSON_ENSURE_ASCII)
+    return json_to_bytes(data, pretty).decode('utf-8')
 
 
-def str_to_json(text: str) -> dict:
-    """Convert JSON string into an object."""
+def json_to_bytes(data: dict, pretty: t.Optional[bool] = None) -> bytes:
+    """Convert an object into UTF-8 encoded JSON."""
+    assert isinstance(data, dict), type(data)
+    pretty = _is_pretty(pretty)
+    if orjson is None:
+        return json_to_str(data, pretty).encode('utf-8')
+    return orjson.dumps(data, option=_ORJSON_OPTIONS if pretty else _ORJSON_COMPACT_OPTIONS)
+
+
+def str_to_json(text: t.Union[str, bytes]) -> dict:
+    """Convert JSON string (or UTF-8 encoded JSON) into an object.
+
+    Use orjson if it is available.
+    """
+    loads = json.loads if orjson is None else orjson.loads
     try:
-        return json.loads(text)
+        return loads(text)
     except json.decoder.JSONDecodeError as err:
-        lines = text.splitlines(keepends=True)
+        doc = err.doc
+        if not isinstance(doc, str):
+            doc = text.decode('utf-8', errors='replace') if isinstance(text, bytes) else text
+        error_line_end = _next_line_start(doc, err.pos)
         raise ValueError(
-            f'\n{"".join(lines[max(0, err.lineno - 10):err.lineno])}{"-" * err.colno}'
-            f'\n{"".join(lines[err.lineno:min(err.lineno + 10, len(lines))])}') from err
+            f'\n{doc[_previous_line_start(doc, err.pos, 9):error_line_end]}{"-" * err.colno}'
+            f'\n{doc[error_line_end:_next_line_start(doc, error_line_end, 9)]}') from err
+
+
+def _previous_line_start(text: str, pos: int, count: int = 0) -> int:
+    """Find where the line containing given position starts, or where a given earlier line starts.
+
+    Only the relevant part of the text is scanned, not the whole text.
+    """
+    line_start = text.rfind('\n', 0, pos) + 1
+    for _ in range(count):
+        if line_start == 0:
+            break
+        line_start = text.rfind('\n', 0, line_start - 1) + 1
+    return line_start
+
+
+def _next_line_start(text: str, pos: int, count: int = 0) -> int:
+    """Find where the line after the one containing given position starts, or a later line starts.
+
+    Only the relevant part of the text is scanned, not the whole text.
+    """
+    line_end = pos
+    for _ in range(count + 1):
+        line_end = text.find('\n', line_end)
+        if line_end == -1:
+            return len(text)
+        line_end += 1
+    return line_end
+
 
+def json_to_file(data: dict, path: pathlib.Path, pretty: t.Optional[bool] = None) -> None:
+    """Save JSON object to a file.
 
-def json_to_file(data: dict, path: pathlib.Path) -> None:
-    """Save JSON object to a file."""
+    The JSON is indented if pretty is True, and compact if it is False. If it is None,
+    the JSON is indented unless INGIT_COMPACT_JSON environment variable is set to 1.
+    """
     assert isinstance(data, dict), type(data)
     assert isinstance(path, pathlib.Path), type(path)
-    text = json_to_str(data)
-    with normalize_path(path).open('w', encoding='utf-8') as json_file:
-        json_file.write(text)
-        json_file.write('\n')
+    with normalize_path(path).open('wb') as json_file:
+        json_file.write(json_to_bytes(data, pretty) + b'\n')
 
 
 def file_to_json(path: pathlib.Path) -> dict:
     """Create JSON object from a file."""
     assert isinstance(path, pathlib.Path), type(path)
-    with normalize_path(path).open('r', encoding='utf-8') as json_file:
+    with normalize_path(path).open('rb') as json_file:
         text = json_file.read()
     try:
         data = str_to_json(text)
@@ -66,7 +146,7 @@ def default_runtime_configuration():
 
 def default_machine_configuration(name=None):
     return {'interactive': True,
-            'name': platform.node() if name is None else name,
+            'name': _HOSTNAME if name is None else name,
             'repos_path': '~'}
 
 
@@ -95,6 +175,5 @@ def acquire_configuration(path: pathlib.Path, config_type: str):
             raise err
         path.parent.mkdir(parents=True, exist_ok=True)
         config = default_generator()
-        json_to_file(config, path)
+        json_to_file(config, path, pretty=True)
         return config
-    return file_to_json(path)
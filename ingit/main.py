@@ -1,19 +1,21 @@
 """Command-line interface of ingit."""
 
 import argparse
+import functools
 import logging
+import os
 import pathlib
+import re
 import sys
+import typing as t
 
-import argcomplete
 from boilerplates.cli import \
-    ArgumentDefaultsAndRawDescriptionHelpFormatter, make_copyright_notice, add_version_option, \
+    ArgumentDefaultsAndRawDescriptionHelpFormatter, make_copyright_notice, \
     add_verbosity_group, get_logging_level, dedent_except_first_line
 from boilerplates.config import initialize_config_directory
 
 from ._version import VERSION
 from .json_config import RUNTIME_CONFIG_PATH, REPOS_CONFIG_PATH
-from .runtime import Runtime
 
 _LOG = logging.getLogger(__name__)
 
@@ -28,9 +30,139 @@ SUGGESTED_TAGS = [
 
 OUT = logging.getLogger('ingit.interface.print')
 
+# set by the shell hook of argcomplete only when completion is in progress
+_COMPLETION_ENVVAR = '_ARGCOMPLETE'
+
+# printed by "ingit --version", also without building the parser
+_VERSION_STRING = f'ingit {VERSION}, Python {sys.version}'
+
+_PREDICATE_EXAMPLES_HELP = '", "'.join(PREDICATE_EXAMPLES)
+
+_REGEX_EXAMPLES_HELP = '", "'.join(REGEX_EXAMPLES)
+
+_COMMANDS = {
+    'summary': (
+        'show summary of registered repositories and status of configured repository root',
+        '''First of all, print a list of registered repositories. By default, all
+        registered repositories are listed, but, as in case of most commands, the
+        results can be filtered via a predicate or regex.
+
+        Independently, print a list of all unregistered repositories and all not
+        versioned paths present in the configured repositories root.'''),
+    'register': (
+        'start tracking a repository in ingit',
+        '''The initial configuration is set according to basic repository information:
+        its root directory name becomes "name" and its currently configured remotes
+        become "remotes". You can edit the configuration manually afterwards.
+
+        The final "path" to the repository stored in the configuration depends on the
+        "repos_path" in runtime configuration. The configured "path" will be:
+
+        *   resolved absolute path if there is no "repos_path" configured or
+            repository path is outside of the "repos_path";
+        *   resolved relative path to the "repos_path", if the repository path is
+            within it;
+        *   nothing (i.e. not stored) if the if the repository is stored directly in
+            "repos_path" (i.e. there are no intermediate directories).
+
+        Behaviour of storing relative/no paths in some cases is implemented to make
+        configuration file much less verbose in typical usage scenarios. To prevent
+        this behaviour, and force all repository paths to be absolute, simply set the
+        "repos_path" in your runtime configuration to JSON "null".'''),
+    'foreach': (
+        'execute a custom command',
+        '''The given command is executed in a shell in working directory of each
+        project.'''),
+    'clone': (
+        'perform git clone',
+        '''Execute "git clone <remote-url> --recursive --origin <remote-name> <path>",
+        where values of <path> and <remote-...> are taken from default remote
+        configuration of the repository.
+
+        After cloning, add all remaining configured remotes to the repository and
+        fetch them.'''),
+    'init': (
+        'perform git init',
+        '''Execute "git init", followed by "git remote add" for each configured
+        remote.'''),
+    'fetch': (
+        'perform git fetch',
+        '''Execute "git fetch <remote-name>", where the remote name is the remote of
+        the current tracking branch, or all remotes of the repository if there's no
+        tracking branch, or repository is in detached head state.'''),
+    'checkout': (
+        'perform git checkout',
+        '''Interactively select revision to checkout from list of local branches, remote
+        non-tracking branches and local tags.
+
+        The list of branches to select from is composed by combining:
+
+        *   local branches
+        *   non-tracking branches on all remotes
+        *   local tags
+
+        Checking out a remote branch will create a local branch with the same unless
+        it already exists. If it already exists, repository will end up in detached
+        head state.
+
+        Also, checking out any tag will put repository in a detached head state.'''),
+    'merge': (
+        'perform git merge (not yet implemented)',
+        '''Not yet implemented! The following functionality is intended.
+
+        Interactively merge all branches to their tracking branches. For each not
+        merged <branch>-<tracking-branch> pair, execute
+        "git checkout <branch>" and then if the merge is fast-forward,
+        automatically execute "git merge <tracking-branch> --ff-only". If not, then
+        show more information about the situation of the repository, and propose:
+
+        *   "git merge --log <tracking-branch>",
+        *   "git rebase -i <tracking-branch>" and
+        *   "git reset --hard <tracking-branch>".
+
+        If repository is dirty when this command is executed, do nothing. After work
+        is done, return to the originally checked-out branch.'''),
+    'push': (
+        'perform git push (not yet fully implemented)',
+        '''Execute "git push <remote-name> <branch>:<tracking-branch-name>" for the
+        active branch.'''),
+    'gc': ('perform git gc', 'Execute "git gc --agressive --prune".'),
+    'status': (
+        'perform git status, as well as other diagnostic git commands',
+        '''Perform git status, as well as other diagnostic git commands.
+
+        Execute:
+
+        *   "git status --short --branch" to inform about any uncommitted changes,
+        *   "git log tracking_branch..branch" to inform about commits that are not
+            yet pushed to the remote,
+        *   "git log branch..tracking_branch" to inform about commits that are not
+            yet merged from the remote.
+
+        Additionally, compare registered remotes with actual remotes to make sure
+        that ingit configuration is in sync with the repository metadata..''')}
+
+_COMMANDS_HELP = '", "'.join(_COMMANDS)
+
+
+@functools.lru_cache(maxsize=16)
+def _regex(text: str) -> t.Pattern[str]:
+    """Compile command-line argument into a regular expression."""
+    try:
+        return re.compile(text)
+    except re.error as err:
+        raise argparse.ArgumentTypeError(f'invalid regex "{text}": {err}') from err
+
+
+def prepare_parser(active_commands: t.Optional[t.FrozenSet[str]] = None):
+    """Prepare command-line arguments parser.
 
-def prepare_parser():
-    """Prepare command-line arguments parser."""
+    If active_commands are given, only these commands get their description and arguments,
+    and other commands are registered just by name and short help. By default, all commands
+    are fully prepared.
+
+    The parser is built once for given active commands and then reused by subsequent calls.
+    """
     parser = argparse.ArgumentParser(
         prog='ingit',
         description='''Tool for managing a large collection of repositories in git. If you have
@@ -39,7 +171,7 @@ def prepare_parser():
             2015, 2024, license_name='GNU General Public License v3 or later (GPLv3+)',
             url='https://github.com/mbdevpl/ingit'),
         formatter_class=argparse.ArgumentDefaultsHelpFormatter, allow_abbrev=True)
-    add_version_option(parser, VERSION)
+    parser.add_argument('--version', action='version', version=_VERSION_STRING)
 
     interactivity_group = parser.add_mutually_exclusive_group(required=False)
     interactivity_group.add_argument(
@@ -65,186 +197,160 @@ def prepare_parser():
     parser.add_argument(
         '--predicate', '-p', type=str, default=None, help=f'''a Python expression used to select
         repositories operated on; it is evaluated on each repository metadata;
-        examples: "{'", "'.join(PREDICATE_EXAMPLES)}"''')
+        examples: "{_PREDICATE_EXAMPLES_HELP}"''')
     parser.add_argument(
-        '--regex', '-r', type=str, default=None, help=f'''a regular expression used to select
+        '--regex', '-r', type=_regex, default=None, help=f'''a regular expression used to select
         repositories operated on; repository matches if any of its metadata match;
-        examples: "{'", "'.join(REGEX_EXAMPLES)}"''')
-
-    commands = {
-        'summary': (
-            'show summary of registered repositories and status of configured repository root',
-            '''First of all, print a list of registered repositories. By default, all
-            registered repositories are listed, but, as in case of most commands, the
-            results can be filtered via a predicate or regex.
-
-            Independently, print a list of all unregistered repositories and all not
-            versioned paths present in the configured repositories root.'''),
-        'register': (
-            'start tracking a repository in ingit',
-            '''The initial configuration is set according to basic repository information:
-            its root directory name becomes "name" and its currently configured remotes
-            become "remotes". You can edit the configuration manually afterwards.
-
-            The final "path" to the repository stored in the configuration depends on the
-            "repos_path" in runtime configuration. The configured "path" will be:
-
-            *   resolved absolute path if there is no "repos_path" configured or
-                repository path is outside of the "repos_path";
-            *   resolved relative path to the "repos_path", if the repository path is
-                within it;
-            *   nothing (i.e. not stored) if the if the repository is stored directly in
-                "repos_path" (i.e. there are no intermediate directories).
-
-            Behaviour of storing relative/no paths in some cases is implemented to make
-            configuration file much less verbose in typical usage scenarios. To prevent
-            this behaviour, and force all repository paths to be absolute, simply set the
-            "repos_path" in your runtime configuration to JSON "null".'''),
-        'foreach': (
-            'execute a custom command',
-            '''The given command is executed in a shell in working directory of each
-            project.'''),
-        'clone': (
-            'perform git clone',
-            '''Execute "git clone <remote-url> --recursive --origin <remote-name> <path>",
-            where values of <path> and <remote-...> are taken from default remote
-            configuration of the repository.
-
-            After cloning, add all remaining configured remotes to the repository and
-            fetch them.'''),
-        'init': (
-            'perform git init',
-            '''Execute "git init", followed by "git remote add" for each configured
-            remote.'''),
-        'fetch': (
-            'perform git fetch',
-            '''Execute "git fetch <remote-name>", where the remote name is the remote of
-            the current tracking branch, or all remotes of the repository if there's no
-            tracking branch, or repository is in detached head state.'''),
-        'checkout': (
-            'perform git checkout',
-            '''Interactively select revision to checkout from list of local branches, remote
-            non-tracking branches and local tags.
-
-            The list of branches to select from is composed by combining:
-
-            *   local branches
-            *   non-tracking branches on all remotes
-            *   local tags
-
-            Checking out a remote branch will create a local branch with the same unless
-            it already exists. If it already exists, repository will end up in detached
-            head state.
-
-            Also, checking out any tag will put repository in a detached head state.'''),
-        'merge': (
-            'perform git merge (not yet implemented)',
-            '''Not yet implemented! The following functionality is intended.
-
-            Interactively merge all branches to their tracking branches. For each not
-            merged <branch>-<tracking-branch> pair, execute
-            "git checkout <branch>" and then if the merge is fast-forward,
-            automatically execute "git merge <tracking-branch> --ff-only". If not, then
-            show more information about the situation of the repository, and propose:
-
-            *   "git merge --log <tracking-branch>",
-            *   "git rebase -i <tracking-branch>" and
-            *   "git reset --hard <tracking-branch>".
-
-            If repository is dirty when this command is executed, do nothing. After work
-            is done, return to the originally checked-out branch.'''),
-        'push': (
-            'perform git push (not yet fully implemented)',
-            '''Execute "git push <remote-name> <branch>:<tracking-branch-name>" for the
-            active branch.'''),
-        'gc': ('perform git gc', 'Execute "git gc --agressive --prune".'),
-        'status': (
-            'perform git status, as well as other diagnostic git commands',
-            '''Perform git status, as well as other diagnostic git commands.
-
-            Execute:
-
-            *   "git status --short --branch" to inform about any uncommitted changes,
-            *   "git log tracking_branch..branch" to inform about commits that are not
-                yet pushed to the remote,
-            *   "git log branch..tracking_branch" to inform about commits that are not
-                yet merged from the remote.
-
-            Additionally, compare registered remotes with actual remotes to make sure
-            that ingit configuration is in sync with the repository metadata..''')}
+        examples: "{_REGEX_EXAMPLES_HELP}"''')
 
     subparsers = parser.add_subparsers(
         dest='command', metavar='command', help=f'''main command to execute; one of:
-        "{'", "'.join(commands.keys())}";
+        "{_COMMANDS_HELP}";
         run "ingit command --help" to see detailed help for a given command''')
 
-    _prepare_command_subparsers(subparsers, commands)
-    argcomplete.autocomplete(parser)
+    _prepare_command_subparsers(subparsers, _COMMANDS, active_commands)
+    if _COMPLETION_ENVVAR in os.environ:
+        import argcomplete  # pylint: disable=import-outside-toplevel
+        argcomplete.autocomplete(parser)
 
     return parser
 
 
-def _prepare_command_subparsers(subparsers, commands):
+def _add_register_arguments(subparser):
+    tags_argument = subparser.add_argument(
+        '--tags', metavar='TAG', type=str, default=None, nargs='+',
+        help='set tags for this repository, they will be added to initial configuration')
+    if _COMPLETION_ENVVAR in os.environ:
+        import argcomplete.completers  # pylint: disable=import-outside-toplevel
+        tags_argument.completer = \
+            argcomplete.completers.ChoicesCompleter(choices=SUGGESTED_TAGS)
+    subparser.add_argument(
+        'path', metavar='PATH', type=str, nargs='?',
+        help='''path to root directory of repository, use current working directory
+        if not provided''')
+
+
+def _add_foreach_arguments(subparser):
+    subparser.add_argument(
+        'cmd', metavar='COMMAND', type=str,
+        help='command to be executed in shell in working directory of each project')
+    # subparser.add_argument(
+    #     '--recursive', action='store_true',
+    #     help='(not yet implemented)')
+    subparser.add_argument(
+        '--timeout', metavar='SECONDS', type=float, default=None,
+        help='timeout of the command (in seconds)')
+
+
+def _positive_int(text: str) -> int:
+    """Convert command-line argument into a positive integer."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f'must be positive, but {value} was given')
+    return value
+
+
+def _add_fetch_arguments(subparser):
+    subparser.add_argument(
+        '--all', action='store_true',
+        help='fetch all remotes in all cases')
+    subparser.add_argument(
+        '--jobs', '-j', metavar='N', type=_positive_int, default=1,
+        help='''number of repositories fetched concurrently;
+        progress of individual fetches is not shown if greater than 1''')
+
+
+def _add_push_arguments(subparser):
+    subparser.add_argument(
+        '--all', action='store_true',
+        help='''(not yet implemented) execute the push for every branch that has a remote
+        tracking branch''')
+
+
+def _add_gc_arguments(subparser):
+    subparser.add_argument(
+        '--jobs', '-j', metavar='N', type=_positive_int, default=1,
+        help='number of repositories processed concurrently')
+
+
+def _add_status_arguments(subparser):
+    subparser.add_argument(
+        '-i', '--ignored', action='store_true',
+        help='''include ignored files in the status report
+        (identical to "--ignored" flag on "git status")''')
+
+
+# used by _prepare_command_subparsers()
+_COMMAND_ARGUMENTS = {
+    'register': _add_register_arguments,
+    'foreach': _add_foreach_arguments,
+    'fetch': _add_fetch_arguments,
+    'push': _add_push_arguments,
+    'gc': _add_gc_arguments,
+    'status': _add_status_arguments}
+
+
+def _prepare_command_subparsers(subparsers, commands, active_commands=None):
     for command, (help_, description) in commands.items():
         subparser = subparsers.add_parser(
             command, help=help_, formatter_class=ArgumentDefaultsAndRawDescriptionHelpFormatter)
+        if active_commands is not None and command not in active_commands:
+            continue
         subparser.description = dedent_except_first_line(description)
-        if command == 'register':
-            subparser.add_argument(
-                '--tags', metavar='TAG', type=str, default=None, nargs='+',
-                help='set tags for this repository, they will be added to initial configuration') \
-                .completer = argcomplete.completers.ChoicesCompleter(choices=SUGGESTED_TAGS)
-            subparser.add_argument(
-                'path', metavar='PATH', type=str, nargs='?',
-                help='''path to root directory of repository, use current working directory
-                if not provided''')
-        elif command == 'foreach':
-            subparser.add_argument(
-                'cmd', metavar='COMMAND', type=str,
-                help='command to be executed in shell in working directory of each project')
-            # subparser.add_argument(
-            #     '--recursive', action='store_true',
-            #     help='(not yet implemented)')
-            subparser.add_argument(
-                '--timeout', metavar='SECONDS', type=float, default=None,
-                help='timeout of the command (in seconds)')
-        elif command == 'fetch':
-            subparser.add_argument(
-                '--all', action='store_true',
-                help='fetch all remotes in all cases')
-        elif command == 'push':
-            subparser.add_argument(
-                '--all', action='store_true',
-                help='''(not yet implemented) execute the push for every branch that has a remote
-                tracking branch''')
-        elif command == 'status':
-            subparser.add_argument(
-                '-i', '--ignored', action='store_true',
-                help='''include ignored files in the status report
-                (identical to "--ignored" flag on "git status")''')
+        add_arguments = _COMMAND_ARGUMENTS.get(command)
+        if add_arguments is not None:
+            add_arguments(subparser)
+
+
+# used by _prepare_command_options(), Path objects are immutable so the default can be shared
+_CWD_PATH = pathlib.Path('.')
+
+# used by _prepare_command_options()
+_COMMAND_OPTIONS = {
+    'register': lambda parsed_args: {
+        'tags': parsed_args.tags,
+        'path': _CWD_PATH if parsed_args.path is None else pathlib.Path(parsed_args.path)},
+    'foreach': lambda parsed_args: {'cmd': parsed_args.cmd, 'timeout': parsed_args.timeout},
+    'fetch': lambda parsed_args: {
+        'all_remotes': parsed_args.all, 'jobs': parsed_args.jobs,
+        'show_progress': parsed_args.jobs == 1},
+    'push': lambda parsed_args: {'all_branches': parsed_args.all},
+    'gc': lambda parsed_args: {'jobs': parsed_args.jobs},
+    'status': lambda parsed_args: {'ignored': parsed_args.ignored}}
 
 
 def _prepare_command_options(command, parsed_args):
-    command_options = {}
-    if command == 'register':
-        command_options['tags'] = parsed_args.tags
-        command_options['path'] = pathlib.Path(
-            '.' if parsed_args.path is None else parsed_args.path)
-    elif command == 'foreach':
-        command_options['cmd'] = parsed_args.cmd
-        command_options['timeout'] = parsed_args.timeout
-    elif command == 'fetch':
-        command_options['all_remotes'] = parsed_args.all
-    elif command == 'push':
-        command_options['all_branches'] = parsed_args.all
-    elif command == 'status':
-        command_options['ignored'] = parsed_args.ignored
-    return command_options
+    prepare_options = _COMMAND_OPTIONS.get(command)
+    if prepare_options is None:
+        return {}
+    return prepare_options(parsed_args)
+
+
+def _is_version_requested(args) -> bool:
+    """Check if "--version" is given among the options that precede the command."""
+    for arg in args:
+        if arg == '--version':
+            return True
+        if not arg.startswith('-') or arg in {'--', '-h', '--help'}:
+            break
+    return False
+
+
+def _sniff_commands(args) -> t.Optional[t.FrozenSet[str]]:
+    """Find which commands may be used in given arguments, or None if all may be."""
+    if _COMPLETION_ENVVAR in os.environ:
+        return None
+    return frozenset(arg for arg in args if arg in _COMMANDS)
 
 
 def main(args=None):
     """Parse command line arguments and run ingit accordingly."""
-    parser = prepare_parser()
+    if args is None:
+        args = sys.argv[1:]
+    if _is_version_requested(args):
+        print(_VERSION_STRING)
+        sys.exit(0)
+    parser = prepare_parser(_sniff_commands(args))
     parsed_args = parser.parse_args(args)
     if (parsed_args.predicate is not None or parsed_args.regex is not None) \
             and parsed_args.command == 'register':
@@ -258,7 +364,6 @@ def main(args=None):
         OUT.critical('%s\ningit: error: %s', parser.format_usage(), err.args[0])
         sys.exit(1)
     OUT.setLevel(level)
-    assert level in {OUT.getEffectiveLevel(), logging.NOTSET}, (level, OUT.getEffectiveLevel())
 
     OUT.info('parsed args: %s', parsed_args)
 
@@ -272,12 +377,10 @@ def main(args=None):
     else:
         predicate_code = f"lambda name, tags, path, remotes: ({parsed_args.predicate})"
         _LOG.warning('prepared predicate lambda: %s', predicate_code)
-        predicate = eval(predicate_code)  # pylint: disable=eval-used
+        predicate = eval(compile(  # pylint: disable=eval-used
+            predicate_code, '<predicate>', 'eval'))
 
-    if parsed_args.regex is None:
-        regex = None
-    else:
-        regex = parsed_args.regex
+    regex = parsed_args.regex
 
     command = parsed_args.command
     if command is None:
@@ -286,12 +389,11 @@ def main(args=None):
     command_options = _prepare_command_options(command, parsed_args)
 
     interactive = None if parsed_args.batch is None else not parsed_args.batch
+    from .runtime import Runtime  # pylint: disable=import-outside-toplevel
     runtime = Runtime(runtime_config_path, repos_config_path, interactive=interactive)
 
-    if predicate is not None:
-        runtime.filter_projects(predicate)
-    if regex is not None:
-        runtime.filter_projects(regex)
+    if predicate is not None or regex is not None:
+        runtime.filter_projects(predicate, regex)
     runtime.execute(command, **command_options)
 
     # run(runtime_config_path, repos_config_path, predicate, regex, command, **command_options)
@@ -4,6 +4,7 @@ import collections
 import collections.abc
 import logging
 import pathlib
+import stat
 import typing as t
 
 from boilerplates.config import normalize_path
@@ -21,6 +22,9 @@ OUT = logging.getLogger('ingit.interface.print')
 
 _SPECIAL_REFS = {'HEAD', 'FETCH_HEAD'}
 
+# used by clone() and _fetch_remote(), number of submodules that git fetches concurrently
+_SUBMODULE_JOBS = 8
+
 
 def normalize_url(url: str):
     return normalize_path(url)
@@ -38,7 +42,7 @@ class Project:
         self.name = name
         self.tags = set(tags)
         self.path = path
-        self.remotes = collections.OrderedDict(list(remotes.items()))
+        self.remotes = dict(remotes)
 
         self.repo: t.Optional[RepoData] = None
 
@@ -60,12 +64,17 @@ class Project:
     @property
     def has_git_folder_or_file(self) -> bool:
         """Return True if repo has .git folder or it has .git file."""
-        return self.has_git_folder or self.has_git_file
+        try:
+            mode = self.path.joinpath('.git').stat().st_mode
+        except (OSError, ValueError):
+            return False
+        return stat.S_ISDIR(mode) or stat.S_ISREG(mode)
 
     @property
     def is_initialised(self) -> bool:
         """Return True if repo exists."""
-        return self.is_existing and self.has_git_folder_or_file
+        # .git can be found only within an existing working directory
+        return self.has_git_folder_or_file
 
     def link_repo(self):
         assert self.repo is None, self.repo
@@ -100,8 +109,8 @@ class Project:
             raise ValueError(f'no configured remotes in repo {self.path}... cannot clone')
         (remote_name, remote_url), remaning_remotes = remotes[0], remotes[1:]
 
-        if ask(f'Execute "git clone {remote_url} --recursive --origin={remote_name}'
-               f' {self.path}"?') != 'y':
+        if ask(f'Execute "git clone {remote_url} --recursive --jobs={_SUBMODULE_JOBS}'
+               f' --origin={remote_name} {self.path}"?') != 'y':
             OUT.warning('skipping %s', self.path)
             return
 
@@ -109,7 +118,7 @@ class Project:
             progress = ActionProgress()
             self.repo = RepoData(git.Repo.clone_from(
                 normalize_url(remote_url), normalize_path(str(self.path)), recursive=True,
-                origin=remote_name, progress=progress))
+                jobs=_SUBMODULE_JOBS, origin=remote_name, progress=progress))
             progress.finalize()
         except git.GitCommandError as err:
             raise ValueError(f'error while cloning "{remote_url}" into "{self.path}"') from err
@@ -139,7 +148,7 @@ class Project:
         for remote_name, remote_url in self.remotes.items():
             self.repo.git.remote('add', remote_name, normalize_url(remote_url))
 
-    def fetch(self, all_remotes: bool = False) -> None:
+    def fetch(self, all_remotes: bool = False, show_progress: bool = True) -> None:
         """Execute "git fetch --prune" on a remote of tracking branch of current branch.
 
         Or execute "git fetch --prune" for all remotes.
@@ -157,7 +166,7 @@ class Project:
         else:
             remote_names = self._determine_remotes_to_fetch()
 
-        self._fetch_remotes(*remote_names)
+        self._fetch_remotes(*remote_names, show_progress=show_progress)
 
     def _determine_remotes_to_fetch(self):
         assert self.repo is not None
@@ -176,13 +185,15 @@ class Project:
             return self.repo.remotes
         return [remote_name]
 
-    def _fetch_remote(self, remote_name: str) -> None:
+    def _fetch_remote(self, remote_name: str, show_progress: bool = True) -> None:
         assert self.repo is not None
         fetch_infos: t.Sequence[git.FetchInfo]
+        progress = ActionProgress() if show_progress else None
         try:
-            progress = ActionProgress()
-            fetch_infos = self.repo.remotes[remote_name].fetch(prune=True, progress=progress)
-            progress.finalize()
+            fetch_infos = self.repo.remotes[remote_name].fetch(
+                prune=True, jobs=_SUBMODULE_JOBS, progress=progress)
+            if progress is not None:
+                progress.finalize()
         except git.GitCommandError as err:
             raise ValueError(f'error while fetching remote "{remote_name}"'
                              f' ("{self.repo.remotes[remote_name].url}") in "{self.name}"') from err
@@ -198,16 +209,18 @@ class Project:
                 pass
         # return fetch_infos
 
-    def _fetch_remotes(self, *remote_names: str) -> None:
+    def _fetch_remotes(self, *remote_names: str, show_progress: bool = True) -> None:
         for remote_name in remote_names:
-            self._fetch_remote(remote_name)
+            self._fetch_remote(remote_name, show_progress)
 
     def _print_fetch_info(self, fetch_info: git.FetchInfo) -> None:
+        level = logging.WARNING if fetch_info.flags & git.FetchInfo.HEAD_UPTODATE \
+            else logging.CRITICAL
+        if not OUT.isEnabledFor(level):
+            return
         info_strings, prefix = create_fetch_info_strings(fetch_info)
         if not info_strings:
             return
-        level = logging.WARNING if fetch_info.flags & git.FetchInfo.HEAD_UPTODATE \
-            else logging.CRITICAL
         OUT.log(level, '%s fetched "%s" in "%s"; %s',
                 prefix, fetch_info.ref, self.name, ', '.join(info_strings))
 
@@ -253,43 +266,28 @@ class Project:
 
     def _prepare_checkout_list(self, keys: str):
         assert self.repo is not None
-        revisions: t.Dict[str, t.Tuple[t.Any, str]] = collections.OrderedDict()
-
         local_branches = list(self.repo.branches)
         remote_tracking_branches = set(self.repo.tracking_branches.values())
         remote_nontracking_branches = [
-            (remote, branch) for remote, branch in self.repo.remote_branches.items()
+            (remote, branch) for remote, branch in self.repo.remote_branches
             if (remote, branch) not in remote_tracking_branches and branch not in _SPECIAL_REFS]
         local_tags = list(self.repo._repo.tags)
 
-        all_candidates_count: int = \
-            len(local_branches) + len(remote_nontracking_branches) + len(local_tags)
-        if all_candidates_count > len(keys):
+        candidates: t.List[t.Tuple[t.Any, t.Optional[str]]] = [
+            (branch, None) for branch in local_branches]
+        candidates += [(tag, 'tag') for tag in local_tags]
+        candidates += [
+            (f'{remote}/{branch}' if branch in self.repo.branches else branch, f'based on {remote}')
+            for remote, branch in remote_nontracking_branches]
+        if len(candidates) > len(keys):
             raise RuntimeError(
                 'not enough available keys to create a single list of checkout candidates'
-                f' - there are {len(keys)} keys ("{keys}") but {all_candidates_count} candidates:'
+                f' - there are {len(keys)} keys ("{keys}") but {len(candidates)} candidates:'
                 f'\n- branches:{local_branches}, {remote_nontracking_branches}'
                 f'\n- tags: {local_tags}')
 
-        index = 0
-        for branch in self.repo.branches:
-            revisions[keys[index]] = (branch, None)
-            index += 1
-
-        for tag in self.repo._repo.tags:
-            revisions[keys[index]] = (tag, 'tag')
-            index += 1
-
-        for (remote, branch) in self.repo.remote_branches.items():
-            if (remote, branch) in remote_tracking_branches \
-                    or branch in _SPECIAL_REFS:
-                continue
-            if branch in self.repo.branches:
-                to_checkout = f'{remote}/{branch}'
-            else:
-                to_checkout = branch
-            revisions[keys[index]] = (to_checkout, f'based on {remote}')
-            index += 1
+        revisions: t.Dict[str, t.Tuple[t.Any, t.Optional[str]]] = \
+            collections.OrderedDict(zip(keys, candidates))
 
         if self.repo.active_branch is None:
             revisions['n'] = ('---', 'keep no branch/tag')
@@ -375,11 +373,13 @@ class Project:
         return push_infos
 
     def _print_push_info(self, push_info: git.PushInfo) -> None:
+        level = logging.WARNING if push_info.flags & git.PushInfo.UP_TO_DATE \
+            else logging.CRITICAL
+        if not OUT.isEnabledFor(level):
+            return
         info_strings, prefix = create_push_info_strings(push_info)
         if not info_strings:
             return
-        level = logging.WARNING if push_info.flags & git.PushInfo.UP_TO_DATE \
-            else logging.CRITICAL
         OUT.log(level, '%s pushed "%s" to "%s" in "%s"; %s', prefix, push_info.local_ref,
                 push_info.remote_ref, self.name, ', '.join(info_strings))
 
@@ -413,13 +413,14 @@ class Project:
         assert self.repo is not None
 
         try:
-            status_log = self.repo.git.status(short=True, branch=True, ignored=ignored).splitlines()
+            status_log = self.repo.git.status(short=True, branch=True, ignored=ignored)
         except git.GitCommandError as err:
             raise ValueError(f'error while getting status of "{self.path}"') from err
 
-        if len(status_log) > 1:
+        # in a clean repository, the status consists of just the branch line
+        if '\n' in status_log:
             OUT.critical('!! unclear status in "%s":', self.path)
-            for line in status_log:
+            for line in status_log.splitlines():
                 OUT.critical(line)
 
         self.repo.refresh()
@@ -497,35 +498,39 @@ class Project:
 
     def _status_remotes(self):
         assert self.repo is not None
-        assert all(len(list(v.urls)) == 1 for v in self.repo.remotes.values()), self.repo.remotes
-        remote_names_in_config = set(self.remotes)
-        remote_names = set(self.repo.remotes)
+        # each access to urls runs "git remote get-url --all"
+        remote_urls = {k: tuple(v.urls) for k, v in self.repo.remotes.items()}
+        assert all(len(urls) == 1 for urls in remote_urls.values()), self.repo.remotes
         remotes_in_config = {k: v.replace('\\', '/') for k, v in self.remotes.items()}
-        remotes = {k: tuple(v.urls)[0].replace('\\', '/') for k, v in self.repo.remotes.items()}
+        remotes = {k: urls[0].replace('\\', '/') for k, urls in remote_urls.items()}
+        if remotes == remotes_in_config:
+            return
 
+        remote_names_in_config = set(self.remotes)
+        remote_names = set(self.repo.remotes)
         extra_remote_names = remote_names - remote_names_in_config
         missing_remote_names = remote_names_in_config - remote_names
         extra_remotes = dict(set(remotes.items()) - set(remotes_in_config.items()))
         missing_remotes = dict(set(remotes_in_config.items()) - set(remotes.items()))
-        if not extra_remotes and not missing_remotes:
-            return
+        missing_remote_names_by_url = {v: k for k, v in missing_remotes.items()}
         OUT.critical('!! repo "%s" has different remotes than it should', self.path)
 
         for name, url in extra_remotes.items():
-            if url in missing_remotes.values():
+            new_name = missing_remote_names_by_url.get(url)
+            if new_name is not None:
                 OUT.critical('!! renamed remote: "%s"', name)
-                new_name = [k for k, v in missing_remotes.items() if url == v][0]
                 ans = ask(f'Rename remote from "{name}" to "{new_name}"?')
                 if ans == 'y':
                     self.repo.git.remote('rename', name, new_name)
                     del missing_remotes[new_name]
-            elif name in missing_remotes.keys():
+                    del missing_remote_names_by_url[url]
+            elif name in missing_remotes:
                 OUT.critical('!! url changed for remote: "%s"', name)
                 ans = ask(f'Change URL of remote "{name}" from "{url}"'
                           f' to "{remotes_in_config[name]}"?')
                 if ans == 'y':
                     self.repo.git.remote('set-url', name, remotes_in_config[name])
-                    del missing_remotes[name]
+                    missing_remote_names_by_url.pop(missing_remotes.pop(name), None)
             else:
                 OUT.critical('!! extra remote: "%s"', name)
                 if name not in extra_remote_names:
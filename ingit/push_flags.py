@@ -1,8 +1,5 @@
 """Human-readable information extraction from git.PushInfo."""
 
-import functools
-import operator
-
 import git
 
 from .fetch_flags import info_for_known_flags, info_for_unknown_flags
@@ -22,12 +19,12 @@ _KNOWN_STRINGS = {
     git.PushInfo.ERROR: 'error'  # 1024
 }
 
-_KNOWN_FLAGS = functools.reduce(operator.or_, _KNOWN_STRINGS.keys())
+_KNOWN_FLAGS = 0x7ff  # all keys of _KNOWN_STRINGS
 
 
 def create_push_info_strings(info: git.PushInfo):
     """Create PushInfo strings."""
-    info_strings = info_for_known_flags(info.flags, _KNOWN_STRINGS)
+    info_strings = info_for_known_flags(info.flags, _KNOWN_STRINGS, _KNOWN_FLAGS)
     prefix = '!!'
     if info.flags & info.UP_TO_DATE:
         prefix = '--'
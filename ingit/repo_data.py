@@ -20,7 +20,7 @@ class RepoData:
         self.branches: t.Mapping[str, git.Reference] = {}
         self._active_branch: t.Optional[str] = None
         self._current_tracking_branch: t.Optional[str] = None
-        self.remote_branches: t.Mapping[str, git.Reference] = {}
+        self.remote_branches: t.Mapping[t.Tuple[str, str], git.Reference] = {}
         self.tracking_branches: t.Mapping[str, git.Reference] = {}
 
     @property
@@ -76,10 +76,11 @@ class RepoData:
         self.branches.update(collections.OrderedDict([(str(_), _) for _ in self._repo.branches]))
         assert all(_ is not None for name, _ in self.branches.items()), (self._repo, self.branches)
 
+        # each call to tracking_branch() reads the repository configuration
+        tracking_refs = {name: _.tracking_branch() for name, _ in self.branches.items()}
         self.tracking_branches = {
-            name: (tuple(str(_.tracking_branch()).partition('/')[::2])
-                   if _.tracking_branch() else None)
-            for name, _ in self.branches.items()}
+            name: (tuple(str(_).partition('/')[::2]) if _ else None)
+            for name, _ in tracking_refs.items()}
 
         default_remote = self.default_remote
         self.remotes = collections.OrderedDict([] if default_remote is None
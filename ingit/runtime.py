@@ -1,8 +1,9 @@
 """The ingit runtime."""
 
 import collections.abc
-import functools
+import concurrent.futures
 import logging
+import os
 import pathlib
 import platform
 import re
@@ -22,13 +23,14 @@ from .project import Project
 _LOG = logging.getLogger(__name__)
 
 
-def regex_predicate(regex: str, name, tags, path, remotes):
+def regex_predicate(regex: t.Union[str, t.Pattern[str]], name, tags, path, remotes):
     """Repo filtering function launched when "ingit -r 'regex' <command> ..." is used."""
+    search = re.compile(regex).search
     return (
-        re.search(regex, name) is not None
-        or any(re.search(regex, tag) is not None for tag in tags)
-        or re.search(regex, str(path)) is not None
-        or any(re.search(regex, name) for name, url in remotes.items()))
+        search(name) is not None
+        or any(search(tag) is not None for tag in tags)
+        or search(str(path)) is not None
+        or any(search(name) for name, url in remotes.items()))
 
 
 class Runtime:
@@ -84,6 +86,7 @@ class Runtime:
     def _read_projects(self) -> t.Sequence[Project]:
         """Get list of all projects in repositories configuration."""
         projects = []
+        repos_path = self.repos_path
         for repo in self.repos_config['repos']:
             name = repo['name']
             assert not ('path' in repo and 'paths' in repo), repo
@@ -99,26 +102,40 @@ class Runtime:
             else:
                 path = pathlib.Path(normalize_path(raw_path))
             if not path.is_absolute():
-                if self.repos_path is None:
+                if repos_path is None:
                     raise ValueError(f'configuration of repository "{name}" must contain absolute'
                                      ' path because repos_path in runtime configuration is not set')
-                path = self.repos_path.joinpath(path)
+                path = repos_path.joinpath(path)
             project = Project(name=name, tags=repo['tags'], path=path, remotes=repo['remotes'])
             projects.append(project)
         return projects
 
-    def filter_projects(self, predicate: t.Union[collections.abc.Callable, str]):
-        """Select subset of all of the projects registered projects for processing."""
-        assert callable(predicate) or isinstance(predicate, str), type(predicate)
+    def filter_projects(
+            self, predicate: t.Optional[t.Union[collections.abc.Callable, str]] = None,
+            regex: t.Optional[t.Union[str, t.Pattern[str]]] = None):
+        """Select subset of all of the projects registered projects for processing.
+
+        If both predicate and regex are given, a project is selected only if it satisfies both.
+        The regex can be given as a string or as a compiled pattern. For backward compatibility,
+        a string predicate is treated as a regex.
+        """
         if isinstance(predicate, str):
-            predicate = functools.partial(regex_predicate, predicate)
+            assert regex is None, regex
+            predicate, regex = None, predicate
+        assert predicate is None or callable(predicate), type(predicate)
+        if isinstance(regex, str):
+            regex = re.compile(regex)
         self.filtered_projects = [
             project for project in self.projects
-            if predicate(project.name, project.tags, project.path, project.remotes)]
+            if (predicate is None
+                or predicate(project.name, project.tags, project.path, project.remotes))
+            and (regex is None
+                 or regex_predicate(
+                     regex, project.name, project.tags, project.path, project.remotes))]
 
     def execute(self, command: str, **command_options):
         """Execute the runtime."""
-        command_executor = {
+        command_executors: t.Dict[str, t.Callable[..., None]] = {
             'summary': self.execute_ingit_command,
             'register': self.execute_ingit_command,
             'foreach': self.execute_ingit_command,
@@ -129,9 +146,9 @@ class Runtime:
             'merge': self.execute_git_command,
             'push': self.execute_git_command,
             'gc': self.execute_git_command,
-            'status': self.execute_git_command}[command]
+            'status': self.execute_git_command}
 
-        command_executor(command, **command_options)
+        command_executors[command](command, **command_options)
 
     def execute_ingit_command(self, command: str, **command_options):
         """Execute an ingit command, as opposed to a wrapper for a git built-in command."""
@@ -142,16 +159,53 @@ class Runtime:
         implementation = getattr(self, command)
         implementation(**command_options)
 
-    def execute_git_command(self, command: str, **command_options):
-        """Execute a wrapper for a git built-in command."""
+    def execute_git_command(self, command: str, jobs: int = 1, **command_options):
+        """Execute a wrapper for a git built-in command.
+
+        If jobs is greater than 1, up to that many projects are processed concurrently.
+        As in the serial case, the first failure stops the command: projects that were not
+        started yet are skipped, the ones already being processed are finished, and then the
+        failure is raised. Failures of other projects that happen in the meantime are logged.
+        """
+        assert jobs >= 1, jobs
         command = {
             'gc': 'collect_garbage'}.get(command, command)
-        for project in self.filtered_projects:
-            implementation = getattr(project, command)
+        if jobs == 1:
+            for project in self.filtered_projects:
+                self._execute_project_command(project, command, **command_options)
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(
+                    self._execute_project_command, project, command, **command_options): project
+                for project in self.filtered_projects}
             try:
-                implementation(**command_options)
-            except RuntimeError:
-                _LOG.exception('failed to execute command "%s" for project %s', command, project)
+                concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+            finally:
+                # also when interrupted, so that leaving the executor does not wait for all of them
+                for future in futures:
+                    future.cancel()
+        failures: t.List[t.Tuple[Project, BaseException]] = []
+        for future, project in futures.items():
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                failures.append((project, error))
+        if not failures:
+            return
+        for project, error in failures[1:]:
+            _LOG.error('failed to execute command "%s" for project %s', command, project,
+                       exc_info=error)
+        raise failures[0][1]
+
+    @staticmethod
+    def _execute_project_command(project: Project, command: str, **command_options):
+        implementation = getattr(project, command)
+        try:
+            implementation(**command_options)
+        except RuntimeError:
+            _LOG.exception('failed to execute command "%s" for project %s', command, project)
 
     def execute_command(self, cmd: str, timeout: t.Optional[int] = None):
         """Execute a command in each of the projects (after filtering was applied)."""
@@ -205,19 +259,21 @@ class Runtime:
             except ValueError:
                 pass
 
-        for path in self.repos_path.iterdir():
-            if not path.is_dir():
-                continue
-            try:
-                _ = git.Repo(str(path))
-            except git.InvalidGitRepositoryError:
-                # TODO: recurse into non-git dir here
-                non_repo_paths_in_root.add(path)
-                continue
-            relative_path = path.relative_to(self.repos_path)
-            if relative_path in project_paths_in_root:
-                continue
-            unregistered_in_root.add(path)
+        with os.scandir(self.repos_path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                path = pathlib.Path(entry.path)
+                try:
+                    _ = git.Repo(entry.path)
+                except git.InvalidGitRepositoryError:
+                    # TODO: recurse into non-git dir here
+                    non_repo_paths_in_root.add(path)
+                    continue
+                relative_path = path.relative_to(self.repos_path)
+                if relative_path in project_paths_in_root:
+                    continue
+                unregistered_in_root.add(path)
 
         if unregistered_in_root:
             print(f'There are {len(unregistered_in_root)} unregistered git repositories'
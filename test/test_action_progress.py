@@ -1,18 +1,40 @@
 """Tests for git operation progress reporting."""
 
+import functools
+import io
 import logging
+import operator
 import sys
 import unittest
 
 import boilerplates.logging
+import git.remote
 
-from ingit.action_progress import ActionProgress, _KNOWN_OPERATIONS_STRINGS as op_codes
+from ingit.action_progress import \
+    ActionProgress, _KNOWN_OPERATIONS_STRINGS as op_codes, _KNOWN_OPERATIONS, \
+    _create_operation_strings
 
 
 class ActionProgressTests(unittest.TestCase):
 
     """Unit tests for ActionProgress."""
 
+    def test_known_operations(self):
+        """Does the known operations mask cover exactly the known operations?"""
+        self.assertEqual(_KNOWN_OPERATIONS, functools.reduce(operator.or_, op_codes))
+
+    def test_operation_strings(self):
+        """Are operation strings created for all set bits of the operation code?"""
+        self.assertEqual(_create_operation_strings(0), ())
+        for op_code, op_string in op_codes.items():
+            self.assertEqual(_create_operation_strings(op_code), (op_string,))
+        all_op_codes = sum(op_codes)
+        self.assertEqual(_create_operation_strings(all_op_codes), tuple(op_codes.values()))
+        strings = _create_operation_strings(2 ** 11 | 1)
+        self.assertEqual(len(strings), 2)
+        self.assertEqual(strings[0], op_codes[1])
+        self.assertTrue(strings[1].startswith('unknown operation code(s): 2048'))
+
     def test_construct(self):
         """Can ActionProgress be constructed?"""
         apr = ActionProgress()
@@ -43,6 +65,38 @@ class ActionProgressTests(unittest.TestCase):
             self.assertTrue(apr.printed_lines)
         apr.finalize()
 
+    def test_update_repeated(self):
+        """Are repeated identical updates of ActionProgress written only once?"""
+        f_d = io.StringIO()
+        apr = ActionProgress(f_d=f_d)
+        apr.update(next(iter(op_codes)), 1, 10, 'testu')
+        written = f_d.getvalue()
+        self.assertTrue(written)
+        apr.update(next(iter(op_codes)), 1, 10, 'testu')
+        self.assertEqual(f_d.getvalue(), written)
+        apr.update(next(iter(op_codes)), 2, 10, 'testu')
+        self.assertNotEqual(f_d.getvalue(), written)
+        apr.finalize()
+        written = f_d.getvalue()
+        apr.update(next(iter(op_codes)), 2, 10, 'testu')
+        self.assertTrue(apr.printed_lines)
+        self.assertNotEqual(f_d.getvalue(), written)
+        apr.finalize()
+
+    def test_update_not_tty(self):
+        """Is ActionProgress output throttled when not writing to a terminal?"""
+        f_d = io.StringIO()
+        apr = ActionProgress(f_d=f_d)
+        self.assertFalse(apr.inline)
+        receiving = git.remote.RemoteProgress.RECEIVING
+        for i in range(1, 10):
+            apr.update(receiving, i, 10)
+        self.assertEqual(len(f_d.getvalue().splitlines()), 1)
+        apr.update(receiving | git.remote.RemoteProgress.END, 10, 10)
+        self.assertEqual(len(f_d.getvalue().splitlines()), 2)
+        apr.finalize()
+        self.assertFalse(apr.printed_lines)
+
     def test_finalize(self):
         """Can ActionProgress be finalised?"""
         apr = ActionProgress()
@@ -0,0 +1,53 @@
+"""Unit tests for human-readable information extraction from git.FetchInfo."""
+
+import functools
+import operator
+import unittest
+
+import git
+
+from ingit.fetch_flags import \
+    _KNOWN_STRINGS, _KNOWN_FLAGS, info_for_known_flags, info_for_unknown_flags, \
+    create_fetch_info_strings
+
+
+class Tests(unittest.TestCase):
+
+    def test_known_flags_mask(self):
+        self.assertEqual(_KNOWN_FLAGS, functools.reduce(operator.or_, _KNOWN_STRINGS))
+
+    def test_known_flags(self):
+        self.assertEqual(info_for_known_flags(0, _KNOWN_STRINGS), [])
+        for flag, string in _KNOWN_STRINGS.items():
+            self.assertEqual(info_for_known_flags(flag, _KNOWN_STRINGS), [string])
+            self.assertEqual(info_for_known_flags(flag, _KNOWN_STRINGS, _KNOWN_FLAGS), [string])
+        flags = git.FetchInfo.NEW_HEAD | git.FetchInfo.FORCED_UPDATE
+        self.assertEqual(
+            info_for_known_flags(flags, _KNOWN_STRINGS),
+            [_KNOWN_STRINGS[git.FetchInfo.NEW_HEAD], _KNOWN_STRINGS[git.FetchInfo.FORCED_UPDATE]])
+
+    def test_unknown_flags(self):
+        unknown_flag = _KNOWN_FLAGS + 1
+        flags = unknown_flag | git.FetchInfo.NEW_TAG
+        self.assertEqual(
+            info_for_known_flags(flags, _KNOWN_STRINGS), [_KNOWN_STRINGS[git.FetchInfo.NEW_TAG]])
+        self.assertEqual(info_for_unknown_flags(git.FetchInfo.NEW_TAG, _KNOWN_FLAGS), [])
+        info_strings = info_for_unknown_flags(flags, _KNOWN_FLAGS)
+        self.assertEqual(len(info_strings), 1)
+        self.assertTrue(info_strings[0].startswith(f'unknown flag(s): {unknown_flag} '))
+
+    def test_create_fetch_info_strings(self):
+        for flag, string in _KNOWN_STRINGS.items():
+            info_strings, prefix = create_fetch_info_strings(git.FetchInfo(None, flag))
+            self.assertEqual(info_strings, [string])
+            self.assertEqual(prefix, '--' if flag == git.FetchInfo.HEAD_UPTODATE else '!!')
+            info_strings, _ = create_fetch_info_strings(git.FetchInfo(None, flag, ' testu '))
+            self.assertEqual(info_strings, [string, 'note: testu'])
+        info_strings, prefix = create_fetch_info_strings(
+            git.FetchInfo(None, git.FetchInfo.HEAD_UPTODATE | git.FetchInfo.TAG_UPDATE))
+        self.assertEqual(info_strings, [
+            _KNOWN_STRINGS[git.FetchInfo.HEAD_UPTODATE], _KNOWN_STRINGS[git.FetchInfo.TAG_UPDATE]])
+        self.assertEqual(prefix, '--')
+        info_strings, prefix = create_fetch_info_strings(git.FetchInfo(None, 0))
+        self.assertEqual(info_strings, [])
+        self.assertEqual(prefix, '!!')
@@ -33,6 +33,11 @@ def call_main(*args, answer='y'):
              + list(args))
 
 
+def _loose_objects_count(repo: git.Repo) -> int:
+    stats = dict(line.split(': ') for line in repo.git.count_objects('-v').splitlines())
+    return int(stats['count'])
+
+
 class Tests(unittest.TestCase):
 
     def setUp(self):
@@ -117,6 +122,13 @@ class Tests(unittest.TestCase):
             self.assertTrue(repo_path.is_dir())
             self.assertTrue(repo_path.joinpath('.git').is_dir())
 
+    def test_fetch_jobs(self):
+        for project_name in PROJECT_NAMES:
+            call_main('-p', f'name == "{project_name}"', 'init')
+        call_main('fetch', '--jobs', str(len(PROJECT_NAMES)))
+        with self.assertRaises(SystemExit):
+            call_main('fetch', '--jobs', '0')
+
     def test_checkout_detached(self):
         for project_name in PROJECT_NAMES:
             repo_path = pathlib.Path(self.repos_path, project_name)
@@ -172,6 +184,23 @@ class Tests(unittest.TestCase):
             self.assertTrue(repo_path.joinpath('.git').is_dir())
             call_main('-p', f'name == "{project_name}"', 'gc')
 
+    def test_gc_jobs(self):
+        repos = []
+        for project_name in PROJECT_NAMES:
+            repo_path = pathlib.Path(self.repos_path, project_name)
+            call_main('-p', f'name == "{project_name}"', 'clone')
+            repo = git.Repo(str(repo_path))
+            repo_path.joinpath('new_file.txt').write_text(project_name, encoding='utf-8')
+            repo.index.add(['new_file.txt'])
+            repo.index.commit('add new file')
+            self.assertGreater(_loose_objects_count(repo), 0)
+            repos.append(repo)
+        call_main('gc', '--jobs', str(len(PROJECT_NAMES)))
+        for repo in repos:
+            self.assertEqual(_loose_objects_count(repo), 0)
+        with self.assertRaises(SystemExit):
+            call_main('gc', '--jobs', '0')
+
     def test_status(self):
         for project_name in PROJECT_NAMES:
             repo_path = pathlib.Path(self.repos_path, project_name)
@@ -11,7 +11,7 @@ from boilerplates.config import normalize_path
 import readchar
 
 from ingit.json_config import \
-    RUNTIME_CONFIG_PATH, REPOS_CONFIG_PATH, \
+    RUNTIME_CONFIG_PATH, REPOS_CONFIG_PATH, COMPACT_JSON_ENVVAR, json_to_str, str_to_json, \
     default_runtime_configuration, default_repos_configuration, acquire_configuration
 
 _LOG = logging.getLogger(__name__)
@@ -19,6 +19,20 @@ _LOG = logging.getLogger(__name__)
 
 class Tests(unittest.TestCase):
 
+    def test_json_to_str(self):
+        data = default_repos_configuration()
+        text = json_to_str(data, pretty=True)
+        self.assertIn('\n  "repos": []', text)
+        self.assertEqual(str_to_json(text), data)
+        compact_text = json_to_str(data, pretty=False)
+        self.assertNotIn('\n', compact_text)
+        self.assertEqual(str_to_json(compact_text), data)
+        with unittest.mock.patch.dict(os.environ, {COMPACT_JSON_ENVVAR: '1'}):
+            self.assertEqual(json_to_str(data), compact_text)
+            self.assertEqual(json_to_str(data, pretty=True), text)
+        with unittest.mock.patch.dict(os.environ, {COMPACT_JSON_ENVVAR: '0'}):
+            self.assertEqual(json_to_str(data), text)
+
     def test_create_runtime_config(self):
         with unittest.mock.patch.object(readchar, 'readchar', return_value='n'):
             with tempfile.NamedTemporaryFile() as tmp_file:
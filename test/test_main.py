@@ -10,7 +10,7 @@ from boilerplates.packaging_tests import run_module
 import readchar
 
 from ingit.json_config import RUNTIME_CONFIG_PATH, REPOS_CONFIG_PATH
-from ingit.main import main
+from ingit.main import prepare_parser, main
 
 
 class Tests(unittest.TestCase):
@@ -20,6 +20,18 @@ class Tests(unittest.TestCase):
             run_module('ingit')
         run_module('ingit', run_name='not_main')
 
+    def test_prepare_parser(self):
+        self.assertIs(prepare_parser(), prepare_parser())
+
+    def test_prepare_parser_active_commands(self):
+        parser = prepare_parser(frozenset({'fetch'}))
+        self.assertTrue(parser.parse_args(['fetch', '--all']).all)
+        self.assertEqual(parser.parse_args(['gc']).command, 'gc')
+        with open(os.devnull, 'a', encoding='utf-8') as devnull:
+            with self.assertRaises(SystemExit):
+                with contextlib.redirect_stderr(devnull):
+                    parser.parse_args(['status', '--ignored'])
+
     def test_help(self):
         with open(os.devnull, 'a', encoding='utf-8') as devnull:
             for flags in (['-h'], ['--help']):
@@ -27,6 +39,13 @@ class Tests(unittest.TestCase):
                     with contextlib.redirect_stdout(devnull):
                         main(flags)
 
+    def test_version(self):
+        with open(os.devnull, 'a', encoding='utf-8') as devnull:
+            for flags in (['--version'], ['--batch', '--version'], ['--vers']):
+                with self.assertRaises(SystemExit):
+                    with contextlib.redirect_stdout(devnull):
+                        main(flags)
+
     def test_filtered_register(self):
         with self.assertRaises(SystemExit):
             main(['-p', 'something', 'register'])
@@ -4,6 +4,7 @@ import contextlib
 import logging
 import os
 import pathlib
+import tempfile
 import unittest
 import unittest.mock
 
@@ -95,6 +96,34 @@ class Tests(boilerplates.git_repo_tests.GitRepoTests):
     # def test_checkout(self):
     #    pass
 
+    def test_checkout_remote_branch(self):
+        source_repo = boilerplates.git_repo_tests.GitRepoTests()
+        source_repo.setUp()
+        self.addCleanup(source_repo.tearDown)
+        source_repo.git_init()
+        source_repo.git_commit_new_file()
+        source_repo.repo.git.branch('feature')
+        remote_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(remote_dir.cleanup)
+        remote_path = str(pathlib.Path(remote_dir.name, 'remote.git'))
+        source_repo.repo.clone(remote_path, bare=True)
+
+        project_path = self.repo_path.joinpath('example')
+        project = Project('example', [], project_path, {'origin': remote_path})
+        with unittest.mock.patch.object(readchar, 'readchar', return_value='y'):
+            project.clone()
+        project.repo.refresh()
+        self.assertDictEqual(project._prepare_checkout_list('12'), {
+            '1': (self.default_branch_name, 'no change'),
+            '2': ('feature', 'based on origin')})
+
+        with unittest.mock.patch.object(readchar, 'readchar', return_value='2'):
+            project.checkout()
+        repo = git.Repo(str(project_path))
+        self.assertFalse(repo.head.is_detached)
+        self.assertEqual(repo.active_branch.name, 'feature')
+        self.assertEqual(str(repo.active_branch.tracking_branch()), 'origin/feature')
+
     def test_checkout_case_sensitive_no(self):
         self.git_init()
         self.git_commit_new_file()
@@ -0,0 +1,13 @@
+"""Unit tests for human-readable information extraction from git.PushInfo."""
+
+import functools
+import operator
+import unittest
+
+from ingit.push_flags import _KNOWN_STRINGS, _KNOWN_FLAGS
+
+
+class Tests(unittest.TestCase):
+
+    def test_known_flags_mask(self):
+        self.assertEqual(_KNOWN_FLAGS, functools.reduce(operator.or_, _KNOWN_STRINGS))
@@ -5,11 +5,16 @@ import pathlib
 import platform
 import shutil
 import tempfile
+import time
+import typing as t
 import unittest
 import unittest.mock
 
+import git
 import readchar
 
+from ingit.json_config import default_repos_configuration, json_to_file
+from ingit.project import Project
 from ingit.runtime import Runtime
 
 HERE = pathlib.Path(__file__).resolve().parent
@@ -20,15 +25,29 @@ TEST_REPOS_CONFIG_PATH = pathlib.Path(HERE, 'examples', 'repos_config', 'example
 _LOG = logging.getLogger(__name__)
 
 
+def _create_bare_remote(path: pathlib.Path) -> str:
+    """Create a bare repository with a single commit, and return hexsha of that commit."""
+    work_path = path.with_name(f'{path.name}_work')
+    repo = git.Repo.init(str(work_path))
+    work_path.joinpath('file.txt').write_text(path.name, encoding='utf-8')
+    repo.index.add(['file.txt'])
+    commit = repo.index.commit('initial commit')
+    repo.clone(str(path), bare=True)
+    return commit.hexsha
+
+
 class Tests(unittest.TestCase):
 
     def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
         with tempfile.NamedTemporaryFile() as tmp_file1:
             with tempfile.NamedTemporaryFile() as tmp_file2:
                 self.repos_config_path = pathlib.Path(tmp_file2.name)
             self.runtime_config_path = pathlib.Path(tmp_file1.name)
 
     def tearDown(self):
+        if platform.system() != 'Windows':
+            self._tmpdir.cleanup()
         if self.runtime_config_path.is_file():
             self.runtime_config_path.unlink()
         if self.repos_config_path.is_file():
@@ -67,6 +86,20 @@ class Tests(unittest.TestCase):
         self.assertIn(platform.node(), [
             machine.get('name') for machine in runtime.runtime_config['machines']])
 
+    def test_filter_projects(self):
+        shutil.copy(str(TEST_RUNTIME_CONFIG_PATH), str(self.runtime_config_path))
+        shutil.copy(str(TEST_REPOS_CONFIG_PATH), str(self.repos_config_path))
+        runtime = Runtime(
+            self.runtime_config_path, self.repos_config_path, hostname='example_machine1')
+        runtime.filter_projects(regex='^python$')
+        self.assertEqual([_.name for _ in runtime.filtered_projects], ['example1'])
+        runtime.filter_projects('^example')
+        self.assertEqual(len(runtime.filtered_projects), 2)
+        runtime.filter_projects(lambda name, *_: name.startswith('example'), '^python$')
+        self.assertEqual([_.name for _ in runtime.filtered_projects], ['example1'])
+        runtime.filter_projects(lambda name, *_: name == 'example2', '^python$')
+        self.assertEqual(runtime.filtered_projects, [])
+
     def test_path_depends_on_machine(self):
         shutil.copy(str(TEST_RUNTIME_CONFIG_PATH), str(self.runtime_config_path))
         shutil.copy(str(TEST_REPOS_CONFIG_PATH), str(self.repos_config_path))
@@ -88,3 +121,59 @@ class Tests(unittest.TestCase):
             self.assertEqual(len(runtime.filtered_projects), 1)
             project = runtime.filtered_projects[0]
             self.assertEqual(project.path, path)
+
+    def _prepare_runtime(self, remote_paths: t.Sequence[pathlib.Path]) -> Runtime:
+        """Prepare runtime with one project per remote, each in a temporary directory."""
+        repos_path = pathlib.Path(self._tmpdir.name, 'repos')
+        repos_config = default_repos_configuration()
+        for i, remote_path in enumerate(remote_paths):
+            repos_config['repos'].append({
+                'name': f'project{i}', 'path': str(repos_path.joinpath(f'project{i}')),
+                'remotes': {'origin': str(remote_path)}, 'tags': []})
+        shutil.copy(str(TEST_RUNTIME_CONFIG_PATH), str(self.runtime_config_path))
+        json_to_file(repos_config, self.repos_config_path)
+        return Runtime(self.runtime_config_path, self.repos_config_path)
+
+    def test_fetch_jobs(self):
+        remotes_path = pathlib.Path(self._tmpdir.name, 'remotes')
+        remote_paths = [remotes_path.joinpath(f'remote{i}.git') for i in range(3)]
+        hexshas = [_create_bare_remote(_) for _ in remote_paths]
+        runtime = self._prepare_runtime(remote_paths)
+        with unittest.mock.patch.object(readchar, 'readchar', return_value='y'):
+            runtime.execute('init')
+        runtime.execute('fetch', all_remotes=False, jobs=len(remote_paths), show_progress=False)
+        for project, hexsha in zip(runtime.filtered_projects, hexshas):
+            repo = git.Repo(str(project.path))
+            self.assertEqual([_.commit.hexsha for _ in repo.remotes['origin'].refs], [hexsha])
+
+    def test_fetch_jobs_failure(self):
+        remotes_path = pathlib.Path(self._tmpdir.name, 'remotes')
+        remote_paths = [remotes_path.joinpath(f'remote{i}.git') for i in range(3)]
+        hexsha = _create_bare_remote(remote_paths[1])
+        runtime = self._prepare_runtime(remote_paths)
+        with unittest.mock.patch.object(readchar, 'readchar', return_value='y'):
+            runtime.execute('init')
+        with self.assertLogs(logger=logging.getLogger('ingit.runtime'), level=logging.ERROR) \
+                as logs, self.assertRaises(ValueError):
+            runtime.execute(
+                'fetch', all_remotes=False, jobs=len(remote_paths), show_progress=False)
+        self.assertEqual(len(logs.records), 1)
+        self.assertIsInstance(logs.records[0].exc_info[1], ValueError)
+        repo = git.Repo(str(runtime.filtered_projects[1].path))
+        self.assertEqual([_.commit.hexsha for _ in repo.remotes['origin'].refs], [hexsha])
+
+    def test_fetch_jobs_failure_skips_remaining(self):
+        remote_paths = [pathlib.Path(self._tmpdir.name, f'remote{i}.git') for i in range(8)]
+        runtime = self._prepare_runtime(remote_paths)
+        fetched = []
+
+        def fetch(project, **_):
+            if project.name == 'project0':
+                raise ValueError(project.name)
+            time.sleep(0.1)
+            fetched.append(project.name)
+
+        with unittest.mock.patch.object(Project, 'fetch', autospec=True, side_effect=fetch), \
+                self.assertRaises(ValueError):
+            runtime.execute('fetch', all_remotes=False, jobs=2, show_progress=False)
+        self.assertLess(len(fetched), len(remote_paths) - 1)